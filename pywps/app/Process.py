@@ -15,6 +15,8 @@ import tempfile
 from pywps import get_ElementMakerForVersion, E, dblog
 from pywps.response import get_response
 from pywps.response.status import WPS_STATUS
+from pywps.response.capabilities import invalidate_capabilities_cache
+from pywps.response.describe import invalidate_describe_cache
 from pywps.response.execute import ExecuteResponse
 from pywps.app.WPSRequest import WPSRequest
 import pywps.configuration as config
@@ -79,10 +81,25 @@ class Process(object):
         else:
             self.status_supported = 'false'
 
+        # memoized json of the process description; the description never
+        # changes after construction, so capabilities/describe requests
+        # should not rebuild it. Execution copies mutate their outputs and
+        # must keep rebuilding, so caching is switched off for them.
+        self._json_cacheable = True
+        self._json = None
+
+        # identifiers of inputs that must be present in every execute
+        # request; computed once, checked per request
+        self._required_input_ids = frozenset(
+            inpt.identifier for inpt in inputs if inpt.min_occurs > 0)
+
     @property
     def json(self):
 
-        return {
+        if self._json is not None:
+            return self._json
+
+        data = {
             'version': self.version,
             'identifier': self.identifier,
             'title': self.title,
@@ -96,6 +113,21 @@ class Process(object):
             'profile': [p for p in self.profile],
         }
 
+        if self._json_cacheable:
+            self._json = data
+        return data
+
+    def invalidate_description(self):
+        """Drop this process's cached description documents.
+
+        Must be called after a registered process is mutated in place
+        (title, abstract, inputs, ...), so that capabilities and
+        describe responses stop serving the memoized description.
+        """
+        self._json = None
+        invalidate_capabilities_cache()
+        invalidate_describe_cache()
+
     def execute(self, wps_request, uuid):
         self._set_uuid(uuid)
         self.async_ = False
@@ -137,8 +169,10 @@ class Process(object):
 
         file_url = config.get_config_value('server', 'outputurl')
 
-        self.status_location = os.path.join(file_path, str(self.uuid)) + '.xml'
-        self.status_url = os.path.join(file_url, str(self.uuid)) + '.xml'
+        self.status_location = os.path.join(file_path, '{}.xml'.format(self.uuid))
+        # URLs always use forward slashes, os.path.join would mis-join
+        # them on windows
+        self.status_url = '{}/{}.xml'.format(file_url.rstrip('/'), self.uuid)
 
     def _execute_process(self, async_, wps_request, wps_response):
         """Uses :module:`pywps.processing` module for sending process to
@@ -20,6 +20,7 @@ from pywps import response
 from pywps.response.status import WPS_STATUS
 
 from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import os
 import sys
 import uuid
@@ -58,6 +59,13 @@ class Service(object):
             if not LOGGER.handlers:
                 LOGGER.addHandler(logging.NullHandler())
 
+        # input type to request-parsing method, see _get_input_creator
+        self._input_creators = {
+            ComplexInput: self.create_complex_inputs,
+            LiteralInput: self.create_literal_inputs,
+            BoundingBoxInput: self.create_bbox_inputs,
+        }
+
     def get_capabilities(self, wps_request, uuid):
 
         response_cls = response.get_response("capabilities")
@@ -91,12 +99,32 @@ class Service(object):
         # so that processes are not overriding each other
         # just for execute
         process = copy.deepcopy(process)
+        # the copy's outputs change while the process runs, so its json
+        # representation must always be rebuilt
+        process._json_cacheable = False
+        process._json = None
         process.service = self
         workdir = os.path.abspath(config.get_config_value('server', 'workdir'))
         tempdir = tempfile.mkdtemp(prefix='pywps_process_', dir=workdir)
         process.set_workdir(tempdir)
         return process
 
+    def _get_input_creator(self, inpt):
+        """Return the method cloning request data into the given input type
+
+        One dict lookup per input instead of an isinstance chain; input
+        subclasses fall back to an MRO scan whose result is cached.
+        """
+        creators = self._input_creators
+        creator = creators.get(type(inpt))
+        if creator is None and type(inpt) not in creators:
+            for klass in type(inpt).__mro__:
+                if klass in creators:
+                    creator = creators[klass]
+                    break
+            creators[type(inpt)] = creator
+        return creator
+
     def _parse_and_execute(self, process, wps_request, uuid):
         """Parse and execute request
         """
@@ -119,52 +147,46 @@ class Service(object):
                     data_inputs[inpt.identifier] = [inpt.clone()]
             else:
 
-                if isinstance(inpt, ComplexInput):
-                    data_inputs[inpt.identifier] = self.create_complex_inputs(
-                        inpt, request_inputs)
-                elif isinstance(inpt, LiteralInput):
-                    data_inputs[inpt.identifier] = self.create_literal_inputs(
-                        inpt, request_inputs)
-                elif isinstance(inpt, BoundingBoxInput):
-                    data_inputs[inpt.identifier] = self.create_bbox_inputs(
-                        inpt, request_inputs)
+                creator = self._get_input_creator(inpt)
+                if creator is not None:
+                    data_inputs[inpt.identifier] = creator(inpt, request_inputs)
 
-        for inpt in process.inputs:
+        missing_inputs = process._required_input_ids.difference(data_inputs)
+        if missing_inputs:
+            # report the first missing input in declaration order
+            identifier = next(inpt.identifier for inpt in process.inputs
+                              if inpt.identifier in missing_inputs)
+            LOGGER.error('Missing parameter value: {}'.format(identifier))
+            raise MissingParameterValue(identifier, identifier)
 
-            if inpt.identifier not in data_inputs:
-                if inpt.min_occurs > 0:
-                    LOGGER.error('Missing parameter value: {}'.format(inpt.identifier))
-                    raise MissingParameterValue(
-                        inpt.identifier, inpt.identifier)
+        self._prefetch_reference_inputs(data_inputs)
 
         wps_request.inputs = data_inputs
 
         # set as_reference to True for all the outputs specified as reference
         # if the output is not required to be raw
         if not wps_request.raw:
+            outputs_by_id = {outpt.identifier: outpt for outpt in process.outputs}
             for wps_outpt in wps_request.outputs:
 
-                is_reference = wps_request.outputs[wps_outpt].get('asReference', 'false')
+                # asReference is lowercased when the request is parsed
+                is_reference = wps_request.outputs[wps_outpt].get('asReference', 'false') == 'true'
                 mimetype = wps_request.outputs[wps_outpt].get('mimetype', '')
-                if is_reference.lower() == 'true':
+                if is_reference:
                     # check if store is supported
                     if process.store_supported == 'false':
                         raise StorageNotSupported(
                             'The storage of data is not supported for this process.')
 
-                    is_reference = True
-                else:
-                    is_reference = False
-
-                for outpt in process.outputs:
-                    if outpt.identifier == wps_outpt:
-                        outpt.as_reference = is_reference
-                        if isinstance(outpt, ComplexOutput) and mimetype != '':
-                            data_format = [f for f in outpt.supported_formats if f.mime_type == mimetype]
-                            if len(data_format) == 0:
-                                raise InvalidParameterValue(
-                                    'MimeType ' + mimetype + ' not valid')
-                            outpt.data_format = data_format[0]
+                outpt = outputs_by_id.get(wps_outpt)
+                if outpt is not None:
+                    outpt.as_reference = is_reference
+                    if isinstance(outpt, ComplexOutput) and mimetype != '':
+                        data_format = [f for f in outpt.supported_formats if f.mime_type == mimetype]
+                        if len(data_format) == 0:
+                            raise InvalidParameterValue(
+                                'MimeType ' + mimetype + ' not valid')
+                        outpt.data_format = data_format[0]
 
         wps_response = process.execute(wps_request, uuid)
         return wps_response
@@ -208,6 +230,26 @@ class Service(object):
             raise MissingParameterValue(description=description, locator=source.identifier)
         return outinputs
 
+    def _prefetch_reference_inputs(self, data_inputs):
+        """Download URL-referenced complex inputs concurrently.
+
+        Fetching is lazy and happens when the file property is first
+        accessed; for several referenced inputs that means strictly
+        serial downloads inside the process. Touching the file property
+        from a thread pool overlaps the waits, so wall-clock time is
+        bound by the slowest reference instead of their sum.
+        """
+        url_inputs = [
+            inpt
+            for inpts in data_inputs.values()
+            for inpt in inpts
+            if isinstance(inpt, ComplexInput) and inpt.prop == 'url'
+        ]
+        if len(url_inputs) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(url_inputs), 8)) as executor:
+                # consume the iterator so download exceptions propagate
+                list(executor.map(lambda inpt: inpt.file, url_inputs))
+
     def create_literal_inputs(self, source, inputs):
         """ Takes the http_request and parses the input to objects
         :return collections.deque:
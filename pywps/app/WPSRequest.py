@@ -7,7 +7,7 @@ import logging
 import lxml
 import lxml.etree
 from werkzeug.exceptions import MethodNotAllowed
-from pywps import get_ElementMakerForVersion
+from pywps import NAMESPACES, get_ElementMakerForVersion
 import base64
 import datetime
 from pywps._compat import text_type, PY2
@@ -19,9 +19,72 @@ from pywps import configuration
 from pywps import get_version_from_ns
 
 import json
+import re
+import threading
 
 LOGGER = logging.getLogger("PYWPS")
 
+# one KVP entry: identifier=value optionally followed by @attribute=value
+# pairs; tokenizing with compiled regexes keeps the loop in C
+_KVP_ENTRY_RE = re.compile(r'([^=@]*)=([^=@]*)((?:@[^=@]+=[^@]*)*)\Z')
+_KVP_ATTR_RE = re.compile(r'@([^=@]+)=([^@]*)')
+
+# parsers for POST bodies, one per thread because lxml parser objects
+# are not thread-safe; the document still has to be materialized as a
+# DOM (embedded ComplexData subtrees and owslib BoundingBox need Element
+# objects), but skipping the XML ID hash keeps construction cheaper than
+# the lxml default parser, and not resolving entities closes the door on
+# entity-expansion attacks
+_parser_local = threading.local()
+
+
+def _get_post_body_parser():
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = lxml.etree.XMLParser(collect_ids=False,
+                                      resolve_entities=False,
+                                      no_network=True)
+        _parser_local.parser = parser
+    return parser
+
+
+# Clark-notation attribute key, hoisted so lxml parses the namespace
+# out of it only once instead of per attrib lookup
+_XLINK_HREF = '{{{}}}href'.format(NAMESPACES['xlink'])
+
+# qualified tag names of well-known direct children, per WPS version,
+# so that inputs/outputs can be read with find() instead of XPath
+_QNAMES_CACHE = {}
+
+
+def _get_qnames(version):
+    """Return dict of namespace-qualified tag names for given WPS version
+    """
+    qnames = _QNAMES_CACHE.get(version)
+    if qnames is None:
+        from pywps import namespaces100, namespaces200
+        nsp = namespaces100 if version == "1.0.0" else namespaces200
+        qnames = {
+            'identifier': '{{{}}}Identifier'.format(nsp['ows']),
+            'data': '{{{}}}Data'.format(nsp['wps']),
+            'literal_data': '{{{}}}LiteralData'.format(nsp['wps']),
+            'complex_data': '{{{}}}ComplexData'.format(nsp['wps']),
+            'bounding_box_data': '{{{}}}BoundingBoxData'.format(nsp['wps']),
+            'reference': '{{{}}}Reference'.format(nsp['wps']),
+            'header': '{{{}}}Header'.format(nsp['wps']),
+            'body': '{{{}}}Body'.format(nsp['wps']),
+            'body_reference': '{{{}}}BodyReference'.format(nsp['wps']),
+            'get_capabilities': '{{{}}}GetCapabilities'.format(nsp['wps']),
+            'describe_process': '{{{}}}DescribeProcess'.format(nsp['wps']),
+            'execute': '{{{}}}Execute'.format(nsp['wps']),
+            'response_form': '{{{}}}ResponseForm'.format(nsp['wps']),
+            'response_document': '{{{}}}ResponseDocument'.format(nsp['wps']),
+            'raw_data_output': '{{{}}}RawDataOutput'.format(nsp['wps']),
+            'output': '{{{}}}Output'.format(nsp['wps']),
+        }
+        _QNAMES_CACHE[version] = qnames
+    return qnames
+
 
 class WPSRequest(object):
 
@@ -85,7 +148,8 @@ class WPSRequest(object):
                                    ' Maximum request size allowed: {} megabytes'.format(maxsize / 1024 / 1024))
 
         try:
-            doc = lxml.etree.fromstring(self.http_request.get_data())
+            doc = lxml.etree.fromstring(self.http_request.get_data(),
+                                        parser=_get_post_body_parser())
         except Exception as e:
             if PY2:
                 raise NoApplicableCode(e.message)
@@ -152,6 +216,10 @@ class WPSRequest(object):
                 _get_get_param(http_request, 'RawDataOutput'))
             wpsrequest.raw = False
             if resp_outputs:
+                # normalized on parse so consumers compare canonical values
+                for outpt in resp_outputs.values():
+                    if 'asReference' in outpt:
+                        outpt['asReference'] = outpt['asReference'].lower()
                 wpsrequest.outputs = resp_outputs
             elif raw_outputs:
                 wpsrequest.outputs = raw_outputs
@@ -227,8 +295,8 @@ class WPSRequest(object):
             wpsrequest.lineage = 'false'
             wpsrequest.store_execute = 'false'
             wpsrequest.status = 'false'
-            wpsrequest.inputs = get_inputs_from_xml(doc)
-            wpsrequest.outputs = get_output_from_xml(doc)
+            wpsrequest.inputs = get_inputs_from_xml(doc, wpsrequest.version)
+            wpsrequest.outputs = get_output_from_xml(doc, wpsrequest.version)
             wpsrequest.raw = False
             if self.xpath_ns(doc, '/wps:Execute/wps:ResponseForm/wps:RawDataOutput'):
                 wpsrequest.raw = True
@@ -246,13 +314,16 @@ class WPSRequest(object):
                 wpsrequest.status = response_document[
                     0].attrib.get('status', 'false')
 
-        if tagname == self.WPS.GetCapabilities().tag:
+        # compare against precomputed qualified tag names; building
+        # throwaway elements just to read their tag is needless work
+        qnames = _get_qnames(self.version)
+        if tagname == qnames['get_capabilities']:
             self.operation = 'getcapabilities'
             return parse_post_getcapabilities
-        elif tagname == self.WPS.DescribeProcess().tag:
+        elif tagname == qnames['describe_process']:
             self.operation = 'describeprocess'
             return parse_post_describeprocess
-        elif tagname == self.WPS.Execute().tag:
+        elif tagname == qnames['execute']:
             self.operation = 'execute'
             return parse_post_execute
         else:
@@ -368,32 +439,43 @@ class WPSRequest(object):
                     self.inputs[identifier] = [inpt]
 
 
-def get_inputs_from_xml(doc):
+def get_inputs_from_xml(doc, version=None):
     the_inputs = {}
-    version = get_version_from_ns(doc.nsmap[doc.prefix])
+    if version is None:
+        version = get_version_from_ns(doc.nsmap[doc.prefix])
     xpath_ns = get_xpath_ns(version)
+    qnames = _get_qnames(version)
     for input_el in xpath_ns(doc, '/wps:Execute/wps:DataInputs/wps:Input'):
-        [identifier_el] = xpath_ns(input_el, './ows:Identifier')
+        identifier_el = input_el.find(qnames['identifier'])
         identifier = identifier_el.text
 
         if identifier not in the_inputs:
             the_inputs[identifier] = []
 
-        literal_data = xpath_ns(input_el, './wps:Data/wps:LiteralData')
-        if literal_data:
-            value_el = literal_data[0]
+        # inputs carry well-known direct children only, so a couple of
+        # find() calls replace per-input XPath queries; find() also skips
+        # comments and processing instructions that child indexing would
+        # trip over
+        data_el = input_el.find(qnames['data'])
+
+        literal_data_el = None
+        if data_el is not None:
+            literal_data_el = data_el.find(qnames['literal_data'])
+
+        if literal_data_el is not None:
             inpt = {}
             inpt['identifier'] = identifier_el.text
-            inpt['data'] = text_type(value_el.text)
-            inpt['uom'] = value_el.attrib.get('uom', '')
-            inpt['datatype'] = value_el.attrib.get('datatype', '')
+            inpt['data'] = text_type(literal_data_el.text)
+            inpt['uom'] = literal_data_el.attrib.get('uom', '')
+            inpt['datatype'] = literal_data_el.attrib.get('datatype', '')
             the_inputs[identifier].append(inpt)
             continue
 
-        complex_data = xpath_ns(input_el, './wps:Data/wps:ComplexData')
-        if complex_data:
+        complex_data_el = None
+        if data_el is not None:
+            complex_data_el = data_el.find(qnames['complex_data'])
 
-            complex_data_el = complex_data[0]
+        if complex_data_el is not None:
             inpt = {}
             inpt['identifier'] = identifier_el.text
             inpt['mimeType'] = complex_data_el.attrib.get('mimeType', '')
@@ -410,63 +492,66 @@ def get_inputs_from_xml(doc):
             the_inputs[identifier].append(inpt)
             continue
 
-        reference_data = xpath_ns(input_el, './wps:Reference')
-        if reference_data:
-            reference_data_el = reference_data[0]
+        reference_data_el = input_el.find(qnames['reference'])
+        if reference_data_el is not None:
             inpt = {}
             inpt['identifier'] = identifier_el.text
             inpt[identifier_el.text] = reference_data_el.text
-            inpt['href'] = reference_data_el.attrib.get(
-                '{http://www.w3.org/1999/xlink}href', '')
+            inpt['href'] = reference_data_el.attrib.get(_XLINK_HREF, '')
             inpt['mimeType'] = reference_data_el.attrib.get('mimeType', '')
             inpt['method'] = reference_data_el.attrib.get('method', 'GET')
-            header_element = xpath_ns(reference_data_el, './wps:Header')
-            if header_element:
+            header_element = reference_data_el.find(qnames['header'])
+            if header_element is not None:
                 inpt['header'] = _get_reference_header(header_element)
-            body_element = xpath_ns(reference_data_el, './wps:Body')
-            if body_element:
-                inpt['body'] = _get_reference_body(body_element[0])
-            bodyreference_element = xpath_ns(reference_data_el,
-                                             './wps:BodyReference')
-            if bodyreference_element:
+            body_element = reference_data_el.find(qnames['body'])
+            if body_element is not None:
+                inpt['body'] = _get_reference_body(body_element)
+            bodyreference_element = reference_data_el.find(
+                qnames['body_reference'])
+            if bodyreference_element is not None:
                 inpt['bodyreference'] = _get_reference_bodyreference(
-                    bodyreference_element[0])
+                    bodyreference_element)
             the_inputs[identifier].append(inpt)
             continue
 
         # Using OWSlib BoundingBox
         from owslib.ows import BoundingBox
-        bbox_datas = xpath_ns(input_el, './wps:Data/wps:BoundingBoxData')
-        if bbox_datas:
-            for bbox_data in bbox_datas:
-                bbox_data_el = bbox_data
+        if data_el is not None:
+            for bbox_data_el in data_el.iterfind(qnames['bounding_box_data']):
                 bbox = BoundingBox(bbox_data_el)
                 the_inputs[identifier].append(bbox)
                 LOGGER.debug("parse bbox: {},{},{},{}".format(bbox.minx, bbox.miny, bbox.maxx, bbox.maxy))
     return the_inputs
 
 
-def get_output_from_xml(doc):
+def get_output_from_xml(doc, version=None):
     the_output = {}
 
-    version = get_version_from_ns(doc.nsmap[doc.prefix])
-    xpath_ns = get_xpath_ns(version)
+    if version is None:
+        version = get_version_from_ns(doc.nsmap[doc.prefix])
+    qnames = _get_qnames(version)
 
-    if xpath_ns(doc, '/wps:Execute/wps:ResponseForm/wps:ResponseDocument'):
-        for output_el in xpath_ns(doc, '/wps:Execute/wps:ResponseForm/wps:ResponseDocument/wps:Output'):
-            [identifier_el] = xpath_ns(output_el, './ows:Identifier')
+    response_form_el = doc.find(qnames['response_form'])
+    if response_form_el is None:
+        return the_output
+
+    response_document_el = response_form_el.find(qnames['response_document'])
+    if response_document_el is not None:
+        for output_el in response_document_el.iterfind(qnames['output']):
+            identifier_el = output_el.find(qnames['identifier'])
             outpt = {}
             outpt[identifier_el.text] = ''
             outpt['mimetype'] = output_el.attrib.get('mimeType', '')
             outpt['encoding'] = output_el.attrib.get('encoding', '')
             outpt['schema'] = output_el.attrib.get('schema', '')
             outpt['uom'] = output_el.attrib.get('uom', '')
-            outpt['asReference'] = output_el.attrib.get('asReference', 'false')
+            # normalized on parse so consumers compare canonical values
+            outpt['asReference'] = output_el.attrib.get('asReference', 'false').lower()
             the_output[identifier_el.text] = outpt
 
-    elif xpath_ns(doc, '/wps:Execute/wps:ResponseForm/wps:RawDataOutput'):
-        for output_el in xpath_ns(doc, '/wps:Execute/wps:ResponseForm/wps:RawDataOutput'):
-            [identifier_el] = xpath_ns(output_el, './ows:Identifier')
+    else:
+        for output_el in response_form_el.iterfind(qnames['raw_data_output']):
+            identifier_el = output_el.find(qnames['identifier'])
             outpt = {}
             outpt[identifier_el.text] = ''
             outpt['mimetype'] = output_el.attrib.get('mimeType', '')
@@ -490,34 +575,33 @@ def get_data_from_kvp(data, part=None):
         return None
 
     for d in data.split(";"):
-        try:
-            io = {}
-            fields = d.split('@')
-
-            # First field is identifier and its value
-            (identifier, val) = fields[0].split("=")
-            io['identifier'] = identifier
-            io['data'] = val
-
-            # Get the attributes of the data
-            for attr in fields[1:]:
-                (attribute, attr_val) = attr.split('=', 1)
-                if attribute == 'xlink:href':
-                    io['href'] = attr_val
-                else:
-                    io[attribute] = attr_val
-
-            # Add the input/output with all its attributes and values to the
-            # dictionary
-            if part == 'DataInputs':
-                if identifier not in the_data:
-                    the_data[identifier] = []
-                the_data[identifier].append(io)
-            else:
-                the_data[identifier] = io
-        except Exception as e:
-            LOGGER.warning(e)
+        match = _KVP_ENTRY_RE.match(d)
+        if match is None:
+            LOGGER.warning('Invalid KVP entry: {}'.format(d))
             the_data[d] = {'identifier': d, 'data': ''}
+            continue
+
+        # First group is identifier and its value
+        (identifier, val, attrs) = match.groups()
+        io = {}
+        io['identifier'] = identifier
+        io['data'] = val
+
+        # Get the attributes of the data
+        for (attribute, attr_val) in _KVP_ATTR_RE.findall(attrs):
+            if attribute == 'xlink:href':
+                io['href'] = attr_val
+            else:
+                io[attribute] = attr_val
+
+        # Add the input/output with all its attributes and values to the
+        # dictionary
+        if part == 'DataInputs':
+            if identifier not in the_data:
+                the_data[identifier] = []
+            the_data[identifier].append(io)
+        else:
+            the_data[identifier] = io
 
     return the_data
 
@@ -539,15 +623,21 @@ def _get_get_param(http_request, key, default=None, aslist=False):
     :param key: key value you need to dig out of the HTTP GET request
     """
 
-    key = key.lower()
-    value = default
     # http_request.args.keys will make + sign disappear in GET url if not
     # urlencoded
-    for k in http_request.args.keys():
-        if k.lower() == key:
-            value = http_request.args.get(k)
-            if aslist:
-                value = value.split(",")
+    args = getattr(http_request, '_lowered_args', None)
+    if args is None:
+        # build the case-insensitive mapping once per request instead of
+        # scanning all arguments on every lookup
+        args = {k.lower(): http_request.args.get(k)
+                for k in http_request.args.keys()}
+        http_request._lowered_args = args
+
+    value = args.get(key.lower())
+    if value is None:
+        return default
+    if aslist:
+        value = value.split(",")
 
     return value
 
@@ -605,5 +695,4 @@ def _get_reference_body(body_element):
 def _get_reference_bodyreference(referencebody_element):
     """Parse ReferenceInput BodyReference element
     """
-    return referencebody_element.attrib.get(
-        '{http://www.w3.org/1999/xlink}href', '')
+    return referencebody_element.attrib.get(_XLINK_HREF, '')
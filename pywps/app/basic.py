@@ -6,12 +6,18 @@
 XML tools
 """
 
+import hashlib
 import logging
+import lxml.etree
 from werkzeug.wrappers import Response
 from pywps import __version__
 
 LOGGER = logging.getLogger('PYWPS')
 
+# compiled XPath expressions, keyed by (version, path), shared by all
+# requests so that libxml2 compiles each expression only once
+_XPATH_CACHE = {}
+
 
 def get_xpath_ns(version):
     """Get xpath namespace for specified WPS version
@@ -22,19 +28,42 @@ def get_xpath_ns(version):
         """Function, which will return xpath namespace for given
         element and xpath
         """
-        if version == "1.0.0":
-            from pywps import namespaces100
-            nsp = namespaces100
-        elif version == "2.0.0":
-            from pywps import namespaces200
-            nsp = namespaces200
-        return ele.xpath(path, namespaces=nsp)
+        key = (version, path)
+        compiled = _XPATH_CACHE.get(key)
+        if compiled is None:
+            if version == "1.0.0":
+                from pywps import namespaces100
+                nsp = namespaces100
+            elif version == "2.0.0":
+                from pywps import namespaces200
+                nsp = namespaces200
+            compiled = lxml.etree.XPath(path, namespaces=nsp)
+            _XPATH_CACHE[key] = compiled
+        return compiled(ele)
 
     return xpath_ns
 
 
-def xml_response(doc):
-    """XML response serializer"""
+def document_etag(doc):
+    """Strong ETag for a serialized response document
+    """
+    body = doc if isinstance(doc, bytes) else doc.encode('utf-8')
+    return hashlib.sha1(body).hexdigest()
+
+
+def xml_response(doc, http_request=None, etag=None):
+    """XML response serializer
+
+    Sets a strong ETag so cache-aware clients can revalidate GetCapabilities
+    and DescribeProcess documents; when the originating request is given,
+    conditional requests are answered with 304 Not Modified. Responses
+    served from a document cache pass the ETag computed at cache-write
+    time so the body is not hashed again per request.
+    """
     response = Response(doc, content_type='text/xml')
     response.status_percentage = 100
+    response.set_etag(etag if etag is not None else document_etag(doc))
+    response.cache_control.public = True
+    if http_request is not None:
+        response.make_conditional(http_request)
     return response
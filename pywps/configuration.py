@@ -16,8 +16,10 @@ import pywps
 from pywps._compat import PY2
 if PY2:
     import ConfigParser
+    _PARSER_ERRORS = (ConfigParser.NoSectionError, ConfigParser.NoOptionError)
 else:
     import configparser
+    _PARSER_ERRORS = (configparser.NoSectionError, configparser.NoOptionError)
 
 __author__ = "Calin Ciociu"
 
@@ -26,6 +28,20 @@ RAW_OPTIONS = [('logging', 'format'), ]
 CONFIG = None
 LOGGER = logging.getLogger("PYWPS")
 
+# bumped on every load_configuration call so that caches derived from
+# configuration values know when to invalidate
+_GENERATION = 0
+
+
+def get_generation():
+    """Return the current configuration generation.
+
+    The generation changes whenever the configuration is (re)loaded.
+    """
+    if not CONFIG:
+        load_configuration()
+    return _GENERATION
+
 
 def get_config_value(section, option):
     """Get desired value from  configuration files
@@ -40,22 +56,66 @@ def get_config_value(section, option):
     if not CONFIG:
         load_configuration()
 
-    value = ''
-
-    if CONFIG.has_section(section):
-        if CONFIG.has_option(section, option):
-            raw = (section, option) in RAW_OPTIONS
-            value = CONFIG.get(section, option, raw=raw)
+    # single parser lookup instead of has_section/has_option/get
+    try:
+        value = CONFIG.get(section, option, raw=(section, option) in RAW_OPTIONS)
+    except _PARSER_ERRORS:
+        return ''
 
-            # Convert Boolean string to real Boolean values
-            if value.lower() == "false":
-                value = False
-            elif value.lower() == "true":
-                value = True
+    # Convert Boolean string to real Boolean values
+    lowered = value.lower()
+    if lowered == "false":
+        value = False
+    elif lowered == "true":
+        value = True
 
     return value
 
 
+_LANGUAGES = (None, None)
+
+
+def get_languages():
+    """Get the list of supported languages (server.language)
+
+    The configured value is split only once per configuration load.
+
+    :returns: list of language codes
+    """
+
+    global _LANGUAGES
+
+    generation = get_generation()
+    if _LANGUAGES[0] != generation:
+        _LANGUAGES = (generation, get_config_value('server', 'language').split(','))
+    return _LANGUAGES[1]
+
+
+def get_config_section(section):
+    """Get all options of given section as a dict snapshot
+
+    Values are returned as strings, without the boolean conversion
+    applied by :func:`get_config_value`; option names are lowercase.
+    Only options set in the section itself are returned: the parser
+    carries os.environ as defaults, and an items() view would
+    interpolate (and include) the whole environment.
+
+    :param section: section in configuration files
+    :type section: string
+    :returns: dict of option name to value, empty if section is missing
+    """
+
+    if not CONFIG:
+        load_configuration()
+
+    if CONFIG.has_section(section):
+        return {option: CONFIG.get(section, option)
+                for option in CONFIG._sections[section]
+                if option != '__name__'}
+
+    return {}
+
+
 def load_configuration(cfgfiles=None):
     """Load PyWPS configuration from configuration files.
     The later configuration file in the array overwrites configuration
@@ -65,6 +125,8 @@ def load_configuration(cfgfiles=None):
     """
 
     global CONFIG
+    global _GENERATION
+    _GENERATION += 1
 
     LOGGER.info('loading configuration')
     if PY2:
@@ -215,8 +215,14 @@ class IOHandler(object):
             elif value_type == SOURCE_TYPE.URL:
                 self.url = value
 
-    def _build_file_name(self, href=''):
-        """Return a file name for the local system."""
+    def _build_file_name(self, href='', reserve=False):
+        """Return a file name for the local system.
+
+        With ``reserve`` the returned name is also created on disk
+        atomically, so concurrent builds against the same workdir (such
+        as prefetched reference downloads) cannot pick the same target;
+        the plain exists() duplicate check is not safe to race.
+        """
         url_path = urlparse(href).path or ''
         file_name = os.path.basename(url_path).strip() or 'input'
         (prefix, suffix) = os.path.splitext(file_name)
@@ -225,8 +231,18 @@ class IOHandler(object):
             file_name = prefix + suffix
         input_file_name = os.path.join(self.workdir, file_name)
 
+        if reserve:
+            try:
+                os.close(os.open(input_file_name,
+                                 os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+            except OSError:
+                # duplicate name; mkstemp reserves a unique one atomically
+                (fd, input_file_name) = tempfile.mkstemp(
+                    suffix=suffix, prefix=prefix + '_',
+                    dir=self.workdir)
+                os.close(fd)
         # build tempfile in case of duplicates
-        if os.path.exists(input_file_name):
+        elif os.path.exists(input_file_name):
             input_file_name = tempfile.mkstemp(
                 suffix=suffix, prefix=prefix + '_',
                 dir=self.workdir)[1]
@@ -418,6 +434,9 @@ class StreamHandler(DataHandler):
 class UrlHandler(FileHandler):
     prop = 'url'
 
+    # size of chunks streamed from the reference to disk
+    CHUNK_SIZE = 64 * 1024
+
     @property
     def url(self):
         """Return the URL."""
@@ -435,9 +454,9 @@ class UrlHandler(FileHandler):
         if self._file is not None:
             return self._file
 
-        self._file = self._build_file_name(href=self.url)
+        self._file = self._build_file_name(href=self.url, reserve=True)
 
-        max_byte_size = self.max_input_size()
+        max_byte_size = int(self.max_input_size())
 
         # Create request
         try:
@@ -449,15 +468,17 @@ class UrlHandler(FileHandler):
         error_message = 'File size for input "{}" exceeded. Maximum allowed: {} megabytes'.format(
             self.inpt.get('identifier', '?'), max_byte_size)
 
-        if int(data_size) > int(max_byte_size):
+        # Content-Length is just a fast-fail preflight; the actual cap is
+        # enforced on the bytes as they arrive
+        if int(data_size) > max_byte_size:
             raise FileSizeExceeded(error_message)
 
         try:
             with open(self._file, 'wb') as f:
                 data_size = 0
-                for chunk in reference_file.iter_content(chunk_size=1024):
+                for chunk in reference_file.iter_content(chunk_size=self.CHUNK_SIZE):
                     data_size += len(chunk)
-                    if int(data_size) > int(max_byte_size):
+                    if data_size > max_byte_size:
                         raise FileSizeExceeded(error_message)
                     f.write(chunk)
 
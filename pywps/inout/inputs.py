@@ -215,7 +215,7 @@ class ComplexInput(basic.ComplexInput):
             if self.data_format.mime_type in ["application/xml", "application/gml+xml", "text/xml"]:
                 # Note that in a client-server round trip, the original and returned file will not be identical.
                 data_doc = etree.parse(self.file)
-                data["data"] = etree.tostring(data_doc, pretty_print=True).decode('utf-8')
+                data["data"] = etree.tostring(data_doc).decode('utf-8')
 
             else:
                 if self.data_format.encoding == 'base64':
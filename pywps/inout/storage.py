@@ -4,7 +4,12 @@
 ##################################################################
 
 import logging
+import math
 import os
+import platform
+import shutil
+import tempfile
+import uuid
 from abc import ABCMeta, abstractmethod
 from pywps._compat import urljoin
 from pywps.exceptions import NotEnoughStorage
@@ -12,6 +17,8 @@ from pywps import configuration as config
 
 LOGGER = logging.getLogger('PYWPS')
 
+_IS_WINDOWS = platform.system() == 'Windows'
+
 
 class STORE_TYPE:
     PATH = 0
@@ -99,22 +106,16 @@ class FileStorage(CachedStorage):
         self.output_url = config.get_config_value('server', 'outputurl')
 
     def _do_store(self, output):
-        import platform
-        import math
-        import shutil
-        import tempfile
-        import uuid
-
         file_name = output.file
 
         request_uuid = output.uuid or uuid.uuid1()
 
         # st.blksize is not available in windows, skips the validation on windows
-        if platform.system() != 'Windows':
-            file_block_size = os.stat(file_name).st_blksize
-            # get_free_space delivers the numer of free blocks, not the available size!
-            avail_size = get_free_space(self.target) * file_block_size
-            file_size = os.stat(file_name).st_size
+        if not _IS_WINDOWS:
+            file_stat = os.stat(file_name)
+            file_block_size = file_stat.st_blksize
+            avail_size = get_free_space(self.target)
+            file_size = file_stat.st_size
 
             # calculate space used according to block size
             actual_file_size = math.ceil(file_size / float(file_block_size)) * file_block_size
@@ -135,12 +136,16 @@ class FileStorage(CachedStorage):
         output_name = file_name + suffix
         # build tempfile in case of duplicates
         if os.path.exists(os.path.join(target, output_name)):
-            output_name = tempfile.mkstemp(suffix=suffix, prefix=file_name + '_',
-                                           dir=target)[1]
+            (fd, tmp_path) = tempfile.mkstemp(suffix=suffix, prefix=file_name + '_',
+                                              dir=target)
+            # mkstemp is used only to reserve a unique name; the copy
+            # below opens the file itself
+            os.close(fd)
+            output_name = os.path.basename(tmp_path)
 
         full_output_name = os.path.join(target, output_name)
         LOGGER.info('Storing file output to {}'.format(full_output_name))
-        shutil.copy2(output.file, full_output_name)
+        _copy_file(output.file, full_output_name)
 
         just_file_name = os.path.basename(output_name)
 
@@ -153,19 +158,70 @@ class FileStorage(CachedStorage):
         return (STORE_TYPE.PATH, output_name, url)
 
 
-def get_free_space(folder):
-    """ Return folder/drive free space (in bytes)
-    """
-    import platform
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux ioctl making the target a copy-on-write clone of the source
+_FICLONE = 0x40049409
+
 
-    if platform.system() == 'Windows':
-        import ctypes
+def _copy_file(source, target):
+    """Copy file contents from source to target.
 
+    Stored outputs do not need the source metadata preserved, so the copy
+    tries, in order: a reflink clone (constant time on copy-on-write
+    filesystems such as btrfs or XFS when both files share a filesystem),
+    an in-kernel os.copy_file_range loop, and shutil.copyfile as the
+    portable fallback.
+    """
+    if fcntl is not None or hasattr(os, 'copy_file_range'):
+        source_fd = os.open(source, os.O_RDONLY)
+        try:
+            target_fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                if fcntl is not None:
+                    try:
+                        fcntl.ioctl(target_fd, _FICLONE, source_fd)
+                        return
+                    except (IOError, OSError):
+                        # different filesystems, or one that cannot reflink
+                        pass
+                if hasattr(os, 'copy_file_range'):
+                    try:
+                        while os.copy_file_range(source_fd, target_fd, 1 << 30):
+                            pass
+                        return
+                    except OSError:
+                        # not supported for this pair of files (e.g.
+                        # cross-device on older kernels)
+                        pass
+            finally:
+                os.close(target_fd)
+        finally:
+            os.close(source_fd)
+    shutil.copyfile(source, target)
+
+
+if _IS_WINDOWS:
+    import ctypes
+
+    def get_free_space(folder):
+        """ Return folder/drive free space (in bytes)
+        """
         free_bytes = ctypes.c_ulonglong(0)
         ctypes.windll.kernel32.GetDiskFreeSpaceExW(ctypes.c_wchar_p(folder), None, None, ctypes.pointer(free_bytes))
         free_space = free_bytes.value
-    else:
-        free_space = os.statvfs(folder).f_bfree
 
-    LOGGER.debug('Free space: {}'.format(free_space))
-    return free_space
+        LOGGER.debug('Free space: {}'.format(free_space))
+        return free_space
+else:
+    def get_free_space(folder):
+        """ Return folder/drive free space (in bytes)
+        """
+        stats = os.statvfs(folder)
+        free_space = stats.f_bavail * stats.f_frsize
+
+        LOGGER.debug('Free space: {}'.format(free_space))
+        return free_space
@@ -3,7 +3,26 @@
 # licensed under MIT, Please consult LICENSE.txt for details     #
 ##################################################################
 
+import json
+import logging
+
+import pywps.configuration as config
+from pywps.app.WPSRequest import WPSRequest
 from pywps.processing.job import Job
+from pywps.response.status import WPS_STATUS
+
+LOGGER = logging.getLogger("PYWPS")
+
+
+def _run_job(job):
+    """Run a job in a pool worker.
+
+    Module level so it can be pickled. The finished response is not
+    returned to the parent: it is no longer picklable once the run has
+    populated its template cache, and the status file and database
+    already carry the outcome.
+    """
+    job.run()
 
 
 class Processing(object):
@@ -34,3 +53,50 @@ class MultiProcessing(Processing):
             args=(self.job.wps_request, self.job.wps_response)
         )
         process.start()
+
+
+class ProcessPool(Processing):
+    """
+    :class:`ProcessPool` runs jobs in a shared pool of warm worker
+    processes, avoiding the per-request process startup cost of
+    :class:`MultiProcessing`. The job must be picklable, which is why
+    this mode is opt-in.
+    """
+
+    _pool = None
+
+    @classmethod
+    def _get_pool(cls):
+        if cls._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            max_workers = int(config.get_config_value('server', 'parallelprocesses'))
+            if max_workers < 1:
+                # unlimited in the configuration; let the pool default to
+                # the machine's processor count
+                max_workers = None
+            cls._pool = ProcessPoolExecutor(max_workers=max_workers)
+        return cls._pool
+
+    def start(self):
+        job = self.job
+        if job.wps_request.http_request is not None:
+            # the originating werkzeug request cannot be pickled and the
+            # worker does not need it; rebuild the request from its json
+            # dump, the same detachment used for dumped jobs
+            detached = WPSRequest()
+            detached.json = json.loads(job.wps_request.json)
+            job.wps_request = detached
+            job.wps_response.wps_request = detached
+        self._future = self._get_pool().submit(_run_job, job)
+        self._future.add_done_callback(self._handle_result)
+
+    def _handle_result(self, future):
+        # _run_process reports its own failures; an exception here means
+        # the job never ran (e.g. it could not be pickled), which would
+        # otherwise leave the client polling an accepted status forever
+        error = future.exception()
+        if error is not None:
+            LOGGER.error('Process {} failed to run in the process pool: {}'.format(
+                self.job.name, error))
+            self.job.wps_response._update_status(
+                WPS_STATUS.FAILED, 'Process error: {}'.format(error), 100)
@@ -1,11 +1,30 @@
 from werkzeug.wrappers import Request
 import pywps.configuration as config
-from pywps.app.basic import xml_response
+from pywps.app.basic import document_etag, xml_response
 from pywps.response import WPSResponse
 from pywps import __version__
 from pywps.exceptions import NoApplicableCode
 import os
 
+# last rendered capabilities document, held as one (key, doc, etag)
+# tuple so concurrent readers always see a consistent snapshot; the
+# response only changes when the configuration is reloaded or the
+# process list differs
+_CACHE = (None, None, None)
+
+
+def invalidate_capabilities_cache():
+    """Drop the cached capabilities document.
+
+    Configuration reloads and changes of the process set are detected
+    automatically; mutating a registered process in place should go
+    through :meth:`pywps.app.Process.Process.invalidate_description`,
+    which also drops the memoized process description and the describe
+    document.
+    """
+    global _CACHE
+    _CACHE = (None, None, None)
+
 
 class CapabilitiesResponse(WPSResponse):
 
@@ -14,6 +33,7 @@ class CapabilitiesResponse(WPSResponse):
         super(CapabilitiesResponse, self).__init__(wps_request, uuid, version)
 
         self.processes = kwargs["processes"]
+        self._doc_etag = None
 
     @property
     def json(self):
@@ -21,50 +41,63 @@ class CapabilitiesResponse(WPSResponse):
         """
 
         processes = [p.json for p in self.processes.values()]
+        # snapshot the section once instead of one ConfigParser walk per key
+        metadata = config.get_config_section('metadata:main')
         return {
             'pywps_version': __version__,
             'version': self.version,
-            'title': config.get_config_value('metadata:main', 'identification_title'),
-            'abstract': config.get_config_value('metadata:main', 'identification_abstract'),
-            'keywords': config.get_config_value('metadata:main', 'identification_keywords').split(","),
-            'keywords_type': config.get_config_value('metadata:main', 'identification_keywords_type').split(","),
-            'fees': config.get_config_value('metadata:main', 'identification_fees'),
-            'accessconstraints': config.get_config_value(
-                'metadata:main',
-                'identification_accessconstraints'
+            'title': metadata.get('identification_title', ''),
+            'abstract': metadata.get('identification_abstract', ''),
+            'keywords': metadata.get('identification_keywords', '').split(","),
+            'keywords_type': metadata.get('identification_keywords_type', '').split(","),
+            'fees': metadata.get('identification_fees', ''),
+            'accessconstraints': metadata.get(
+                'identification_accessconstraints', ''
             ).split(','),
-            'profile': config.get_config_value('metadata:main', 'identification_profile'),
+            'profile': metadata.get('identification_profile', ''),
             'provider': {
-                'name': config.get_config_value('metadata:main', 'provider_name'),
-                'site': config.get_config_value('metadata:main', 'provider_url'),
-                'individual': config.get_config_value('metadata:main', 'contact_name'),
-                'position': config.get_config_value('metadata:main', 'contact_position'),
-                'voice': config.get_config_value('metadata:main', 'contact_phone'),
-                'fascimile': config.get_config_value('metadata:main', 'contaact_fax'),
+                'name': metadata.get('provider_name', ''),
+                'site': metadata.get('provider_url', ''),
+                'individual': metadata.get('contact_name', ''),
+                'position': metadata.get('contact_position', ''),
+                'voice': metadata.get('contact_phone', ''),
+                'fascimile': metadata.get('contaact_fax', ''),
                 'address': {
-                    'delivery': config.get_config_value('metadata:main', 'deliveryPoint'),
-                    'city': config.get_config_value('metadata:main', 'contact_city'),
-                    'state': config.get_config_value('metadata:main', 'contact_stateorprovince'),
-                    'postalcode': config.get_config_value('metadata:main', 'contact_postalcode'),
-                    'country': config.get_config_value('metadata:main', 'contact_country'),
-                    'email': config.get_config_value('metadata:main', 'contact_email')
+                    'delivery': metadata.get('deliverypoint', ''),
+                    'city': metadata.get('contact_city', ''),
+                    'state': metadata.get('contact_stateorprovince', ''),
+                    'postalcode': metadata.get('contact_postalcode', ''),
+                    'country': metadata.get('contact_country', ''),
+                    'email': metadata.get('contact_email', '')
                 },
-                'url': config.get_config_value('metadata:main', 'contact_url'),
-                'hours': config.get_config_value('metadata:main', 'contact_hours'),
-                'instructions': config.get_config_value('metadata:main', 'contact_instructions'),
-                'role': config.get_config_value('metadata:main', 'contact_role')
+                'url': metadata.get('contact_url', ''),
+                'hours': metadata.get('contact_hours', ''),
+                'instructions': metadata.get('contact_instructions', ''),
+                'role': metadata.get('contact_role', '')
             },
             'serviceurl': config.get_config_value('server', 'url'),
-            'languages': config.get_config_value('server', 'language').split(','),
+            'languages': config.get_languages(),
             'processes': processes
         }
 
     def _construct_doc(self):
+        global _CACHE
+
+        # process instances compare by identity, so a service with other
+        # process objects cannot be served a stale document
+        key = (config.get_generation(), self.version,
+               tuple(self.processes.values()))
+        cached_key, cached_doc, cached_etag = _CACHE
+        if key == cached_key:
+            self._doc_etag = cached_etag
+            return cached_doc
 
         template = self.template_env.get_template(self.version + '/capabilities/main.xml')
 
         doc = template.render(**self.json)
 
+        self._doc_etag = document_etag(doc)
+        _CACHE = (key, doc, self._doc_etag)
         return doc
 
     @Request.application
@@ -72,7 +105,7 @@ class CapabilitiesResponse(WPSResponse):
         # This function must return a valid response.
         try:
             doc = self.get_response_doc()
-            return xml_response(doc)
+            return xml_response(doc, request, etag=self._doc_etag)
         except NoApplicableCode as e:
             return e
         except Exception as e:
@@ -1,6 +1,6 @@
 from werkzeug.wrappers import Request
 import pywps.configuration as config
-from pywps.app.basic import xml_response
+from pywps.app.basic import document_etag, xml_response
 from pywps.exceptions import NoApplicableCode
 from pywps.exceptions import MissingParameterValue
 from pywps.exceptions import InvalidParameterValue
@@ -8,6 +8,24 @@ from pywps.response import WPSResponse
 from pywps import __version__
 import os
 
+# last rendered describe document, held as one (key, doc, etag) tuple so
+# concurrent readers always see a consistent snapshot; process
+# descriptions are static, so the document only changes with the
+# configuration, the requested identifiers or the process set (see
+# pywps.response.capabilities)
+_CACHE = (None, None, None)
+
+
+def invalidate_describe_cache():
+    """Drop the cached describe document.
+
+    Needed only when a registered process object is mutated in place;
+    configuration reloads and changes of the process set are detected
+    automatically.
+    """
+    global _CACHE
+    _CACHE = (None, None, None)
+
 
 class DescribeResponse(WPSResponse):
 
@@ -19,21 +37,19 @@ class DescribeResponse(WPSResponse):
         if "identifiers" in kwargs:
             self.identifiers = kwargs["identifiers"]
         self.processes = kwargs["processes"]
+        self._doc_etag = None
 
     @property
     def json(self):
 
-        processes = []
-
-        if 'all' in (ident.lower() for ident in self.identifiers):
-            processes = (self.processes[p].json for p in self.processes)
+        if any(ident.lower() == 'all' for ident in self.identifiers):
+            processes = [p.json for p in self.processes.values()]
         else:
-            for identifier in self.identifiers:
-                if identifier not in self.processes:
-                    msg = "Unknown process {}".format(identifier)
-                    raise InvalidParameterValue(msg, "identifier")
-                else:
-                    processes.append(self.processes[identifier].json)
+            unknown = [ident for ident in self.identifiers if ident not in self.processes]
+            if unknown:
+                msg = "Unknown process {}".format(unknown[0])
+                raise InvalidParameterValue(msg, "identifier")
+            processes = [self.processes[ident].json for ident in self.identifiers]
 
         return {
             'pywps_version': __version__,
@@ -42,14 +58,24 @@ class DescribeResponse(WPSResponse):
         }
 
     def _construct_doc(self):
+        global _CACHE
 
         if not self.identifiers:
             raise MissingParameterValue('Missing parameter value "identifier"', 'identifier')
 
+        key = (config.get_generation(), self.version, tuple(self.identifiers),
+               tuple(self.processes.values()))
+        cached_key, cached_doc, cached_etag = _CACHE
+        if key == cached_key:
+            self._doc_etag = cached_etag
+            return cached_doc
+
         template = self.template_env.get_template(self.version + '/describe/main.xml')
         max_size = int(config.get_size_mb(config.get_config_value('server', 'maxsingleinputsize')))
         doc = template.render(max_size=max_size, **self.json)
 
+        self._doc_etag = document_etag(doc)
+        _CACHE = (key, doc, self._doc_etag)
         return doc
 
     @Request.application
@@ -57,7 +83,7 @@ class DescribeResponse(WPSResponse):
         # This function must return a valid response.
         try:
             doc = self.get_response_doc()
-            return xml_response(doc)
+            return xml_response(doc, request, etag=self._doc_etag)
         except NoApplicableCode as e:
             return e
         except Exception as e:
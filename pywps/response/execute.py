@@ -23,15 +23,49 @@ from pywps._compat import PY2
 if PY2:
     import urlparse
     from urllib import urlencode
+    _monotonic = time.time
 else:
     import urllib.parse as urlparse
     from urllib.parse import urlencode
+    _monotonic = time.monotonic
 
 LOGGER = logging.getLogger("PYWPS")
 
+# minimum interval in seconds between non-terminal status-file writes;
+# terminal states are always flushed
+_STATUS_WRITE_INTERVAL = 0.25
+
 WPS, OWS = get_ElementMakerForVersion("1.0.0")
 
 
+def _creation_time():
+    """Status timestamp; UTC, as the trailing Z promises."""
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+
+# serviceInstance URL derives only from the configured server URL, so it
+# is rebuilt only when the configuration is reloaded
+_SERVICE_INSTANCE = (None, None)
+
+
+def _get_serviceinstance_url():
+    global _SERVICE_INSTANCE
+
+    generation = config.get_generation()
+    if _SERVICE_INSTANCE[0] != generation:
+        url = config.get_config_value("server", "url")
+        params = {'request': 'GetCapabilities', 'service': 'WPS'}
+
+        url_parts = list(urlparse.urlparse(url))
+        query = dict(urlparse.parse_qsl(url_parts[4]))
+        query.update(params)
+
+        url_parts[4] = urlencode(query)
+        _SERVICE_INSTANCE = (
+            generation, urlparse.urlunparse(url_parts).replace("&", "&amp;"))
+    return _SERVICE_INSTANCE[1]
+
+
 class ExecuteResponse(WPSResponse):
 
     def __init__(self, wps_request, uuid, **kwargs):
@@ -47,6 +81,10 @@ class ExecuteResponse(WPSResponse):
         self.process = kwargs["process"]
         self.outputs = {o.identifier: o for o in self.process.outputs}
         self.store_status_file = False
+        # (status, message, percentage) of the last document build, used
+        # to skip rebuilding identical status documents
+        self._last_doc_key = None
+        self._last_file_write = 0
 
     # override WPSResponse._update_status
     def _update_status(self, status, message, status_percentage, clean=True):
@@ -61,9 +99,20 @@ class ExecuteResponse(WPSResponse):
         """
         super(ExecuteResponse, self)._update_status(status, message, status_percentage)
         LOGGER.debug("_update_status: status={}, clean={}".format(status, clean))
-        self._update_status_doc()
-        if self.store_status_file:
-            self._update_status_file()
+        doc_key = (self.status, self.message, self.status_percentage)
+        if doc_key != self._last_doc_key:
+            # everything else in the document is invariant, so repeated
+            # updates with the same state need neither rebuild nor write
+            self._last_doc_key = doc_key
+            self._update_status_doc()
+            if self.store_status_file:
+                # coalesce frequent progress ticks; each write costs a
+                # device-level sync
+                terminal = status in (WPS_STATUS.SUCCEEDED, WPS_STATUS.FAILED)
+                now = _monotonic()
+                if terminal or now - self._last_file_write >= _STATUS_WRITE_INTERVAL:
+                    self._update_status_file()
+                    self._last_file_write = now
         if clean:
             if self.status == WPS_STATUS.SUCCEEDED or self.status == WPS_STATUS.FAILED:
                 LOGGER.debug("clean workdir: status={}".format(status))
@@ -93,49 +142,57 @@ class ExecuteResponse(WPSResponse):
     def _update_status_file(self):
         # TODO: check if file/directory is still present, maybe deleted in mean time
         try:
-            # update the status xml file
-            with open(self.process.status_location, 'w') as f:
-                f.write(self.doc)
-                f.flush()
-                os.fsync(f.fileno())
+            # update the status xml file with a single write; O_DSYNC lets
+            # the kernel combine the write and the data sync, falling back
+            # to an explicit fsync where the flag does not exist
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_DSYNC', 0)
+            fd = os.open(self.process.status_location, flags, 0o666)
+            try:
+                os.write(fd, self.doc.encode('utf-8'))
+                if not hasattr(os, 'O_DSYNC'):
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
         except Exception as e:
             raise NoApplicableCode('Writing Response Document failed with : {}'.format(e))
 
-    def _process_accepted(self):
+    def _process_accepted(self, creation_time=None):
         percent = int(self.status_percentage)
         if percent > 99:
             percent = 99
+        if creation_time is None:
+            creation_time = _creation_time()
         return {
             "status": "accepted",
-            "time": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.localtime()),
+            "time": creation_time,
             "percent_done": str(percent),
             "message": self.message
         }
 
-    def _process_started(self):
-        data = self._process_accepted()
+    def _process_started(self, creation_time=None):
+        data = self._process_accepted(creation_time)
         data.update({
             "status": "started",
         })
         return data
 
-    def _process_paused(self):
-        data = self._process_accepted()
+    def _process_paused(self, creation_time=None):
+        data = self._process_accepted(creation_time)
         data.update({
             "status": "paused",
         })
         return data
 
-    def _process_succeeded(self):
-        data = self._process_accepted()
+    def _process_succeeded(self, creation_time=None):
+        data = self._process_accepted(creation_time)
         data.update({
             "status": "succeeded",
             "percent_done": "100"
         })
         return data
 
-    def _process_failed(self):
-        data = self._process_accepted()
+    def _process_failed(self, creation_time=None):
+        data = self._process_accepted(creation_time)
         data.update({
             "status": "failed",
             "code": "NoApplicableCode",
@@ -144,16 +201,7 @@ class ExecuteResponse(WPSResponse):
         return data
 
     def _get_serviceinstance(self):
-
-        url = config.get_config_value("server", "url")
-        params = {'request': 'GetCapabilities', 'service': 'WPS'}
-
-        url_parts = list(urlparse.urlparse(url))
-        query = dict(urlparse.parse_qsl(url_parts[4]))
-        query.update(params)
-
-        url_parts[4] = urlencode(query)
-        return urlparse.urlunparse(url_parts).replace("&", "&amp;")
+        return _get_serviceinstance_url()
 
     @property
     def json(self):
@@ -166,19 +214,21 @@ class ExecuteResponse(WPSResponse):
             if self.process.status_location:
                 data["status_location"] = self.process.status_url
 
+        # single timestamp per document build, shared by all status helpers
+        now = _creation_time()
         if self.status == WPS_STATUS.ACCEPTED:
             self.message = 'PyWPS Process {} accepted'.format(self.process.identifier)
-            data["status"] = self._process_accepted()
+            data["status"] = self._process_accepted(now)
         elif self.status == WPS_STATUS.STARTED:
-            data["status"] = self._process_started()
+            data["status"] = self._process_started(now)
         elif self.status == WPS_STATUS.FAILED:
             # check if process failed and display fail message
-            data["status"] = self._process_failed()
+            data["status"] = self._process_failed(now)
         elif self.status == WPS_STATUS.PAUSED:
             # TODO: handle paused status
-            data["status"] = self._process_paused()
+            data["status"] = self._process_paused(now)
         elif self.status == WPS_STATUS.SUCCEEDED:
-            data["status"] = self._process_succeeded()
+            data["status"] = self._process_succeeded(now)
 
             # DataInputs and DataOutputs definition XML if lineage=true
             if self.wps_request.lineage == 'true':
@@ -42,6 +42,27 @@ class BadRequestTest(unittest.TestCase):
         assert resp.status_code == 400
 
 
+class InvalidateDescriptionTest(unittest.TestCase):
+
+    def test_invalidate_description(self):
+        def pr1(): pass
+        process = Process(pr1, 'pr_mut', 'Initial Title')
+        client = client_for(Service(processes=[process]))
+
+        resp = client.get('?Request=GetCapabilities&service=WPS')
+        assert 'Initial Title' in resp.data.decode('utf-8')
+        resp = client.get('?Request=DescribeProcess&service=WPS&version=1.0.0&identifier=pr_mut')
+        assert 'Initial Title' in resp.data.decode('utf-8')
+
+        process.title = 'Changed Title'
+        process.invalidate_description()
+
+        resp = client.get('?Request=GetCapabilities&service=WPS')
+        assert 'Changed Title' in resp.data.decode('utf-8')
+        resp = client.get('?Request=DescribeProcess&service=WPS&version=1.0.0&identifier=pr_mut')
+        assert 'Changed Title' in resp.data.decode('utf-8')
+
+
 class CapabilitiesTest(unittest.TestCase):
 
     def setUp(self):
@@ -120,6 +141,7 @@ def load_tests(loader=None, tests=None, pattern=None):
         loader = unittest.TestLoader()
     suite_list = [
         loader.loadTestsFromTestCase(BadRequestTest),
+        loader.loadTestsFromTestCase(InvalidateDescriptionTest),
         loader.loadTestsFromTestCase(CapabilitiesTest),
     ]
     return unittest.TestSuite(suite_list)
@@ -484,6 +484,17 @@ class ExecuteXmlParserTest(unittest.TestCase):
         self.assertEqual(rv['name'][0]['data'], 'foo')
         self.assertEqual(rv['name'][1]['data'], 'bar')
 
+    def test_string_with_comment(self):
+        request_doc = WPS.Execute(
+            OWS.Identifier('foo'),
+            WPS.DataInputs(
+                WPS.Input(
+                    OWS.Identifier('name'),
+                    WPS.Data(lxml.etree.Comment('note'),
+                             WPS.LiteralData('foo')))))
+        rv = get_inputs_from_xml(request_doc)
+        self.assertEqual(rv['name'][0]['data'], 'foo')
+
     def test_two_strings(self):
         request_doc = WPS.Execute(
             OWS.Identifier('foo'),
@@ -633,6 +644,15 @@ class ExecuteXmlParserTest(unittest.TestCase):
         self.assertTrue(inpt_filename.startswith(os.path.join(workdir, 'duplicate_')))
         self.assertTrue(inpt_filename.endswith('.html'))
 
+        # reserved names are created on disk, so two builds for the same
+        # href cannot collide even when they run concurrently
+        first = h._build_file_name('http://path/to/shared.xml', reserve=True)
+        self.assertEqual(first, os.path.join(workdir, 'shared.xml'))
+        self.assertTrue(os.path.exists(first))
+        second = h._build_file_name('http://path/to/shared.xml', reserve=True)
+        self.assertNotEqual(first, second)
+        self.assertTrue(os.path.exists(second))
+
 
 def load_tests(loader=None, tests=None, pattern=None):
     if not loader:
@@ -6,17 +6,28 @@
 """Unit tests for processing
 """
 
+import os
+import tempfile
 import unittest
 
 from pywps import configuration
 import pywps.processing
-from pywps.processing.basic import MultiProcessing
+from pywps.processing.basic import MultiProcessing, ProcessPool
 from pywps import Process
 from pywps.app import WPSRequest
 from pywps.response.execute import ExecuteResponse
 from pywps import LiteralOutput
 
 
+def pool_handler(request, response):
+    """Handler for the process pool test; must be picklable, hence
+    module level. Leaves a marker next to the workdir so the parent
+    process can observe that the job really ran."""
+    open(response.process.workdir + '.done', 'w').close()
+    response.outputs['output'].data = '42'
+    return response
+
+
 class ProcessingTest(unittest.TestCase):
     """Processing test cases"""
 
@@ -47,6 +58,50 @@ class ProcessingTest(unittest.TestCase):
         # process.start()
         self.assertTrue(isinstance(process, MultiProcessing))
 
+    def test_processpool_mode(self):
+        """Test the opt-in process pool mode
+        """
+        configuration.CONFIG.set('processing', 'mode', 'processpool')
+        try:
+            process = pywps.processing.Process(
+                process=self.dummy_process,
+                wps_request=self.wps_request,
+                wps_response=self.wps_response)
+            self.assertTrue(isinstance(process, ProcessPool))
+        finally:
+            configuration.CONFIG.set('processing', 'mode', 'default')
+
+    def test_processpool_start(self):
+        """Test that pooled jobs are detached from the request and run
+        """
+        pool_process = Process(
+            handler=pool_handler,
+            identifier='dummy_pool',
+            title='Dummy Pool Process',
+            outputs=[LiteralOutput('output', 'Output', data_type='string')])
+        pool_process.set_workdir(tempfile.mkdtemp())
+        marker = pool_process.workdir + '.done'
+        wps_request = WPSRequest()
+        # not picklable, as in a live service; start() must strip it
+        wps_request.http_request = open(os.devnull)
+        wps_response = ExecuteResponse(wps_request, self.uuid,
+                process=pool_process)
+        configuration.CONFIG.set('processing', 'mode', 'processpool')
+        try:
+            process = pywps.processing.Process(
+                process=pool_process,
+                wps_request=wps_request,
+                wps_response=wps_response)
+            process.start()
+            process._future.result(timeout=60)
+            self.assertIsNone(process.job.wps_request.http_request)
+            self.assertTrue(os.path.exists(marker))
+        finally:
+            wps_request.http_request.close()
+            configuration.CONFIG.set('processing', 'mode', 'default')
+            if os.path.exists(marker):
+                os.remove(marker)
+
 
 def load_tests(loader=None, tests=None, pattern=None):
     """Load local tests